@@ -1,6 +1,7 @@
-import requests
-import time
-from datetime import datetime, timedelta
+import asyncio
+import aiohttp
+from aiolimiter import AsyncLimiter
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv, find_dotenv
 import os
 
@@ -12,90 +13,149 @@ API_KEY = os.getenv("twitterapiio_key")
 if not API_KEY:
     raise RuntimeError("twitterapiio_key not set in environment")
 
-TARGET_ACCOUNT = "nelvOfficial"  # The account you want to monitor
+# Comma-separated handles to monitor, e.g. TARGETS=nelvOfficial,ern1337
+TARGET_ACCOUNTS = [a.strip() for a in os.getenv("TARGETS", "nelvOfficial").split(",") if a.strip()]
 CHECK_INTERVAL = 300  # Check every 5 minutes (300 seconds)
-LAST_CHECKED_TIME = datetime.utcnow() - timedelta(hours=1)  # Start by checking the last hour
-
-def check_for_new_tweets():
-    global LAST_CHECKED_TIME
-    
-    # Format times for the API query
-    until_time = datetime.utcnow()
-    since_time = LAST_CHECKED_TIME
-    
-    # Format times as strings in the format Twitter's API expects
-    since_str = since_time.strftime("%Y-%m-%d_%H:%M:%S_UTC")
-    until_str = until_time.strftime("%Y-%m-%d_%H:%M:%S_UTC")
-    
-    # Construct the query
-    query = f"from:{TARGET_ACCOUNT} since:{since_str} until:{until_str} include:nativeretweets"
-    # Please refer to this document for detailed Twitter advanced search syntax. 
+
+# Cap simultaneous in-flight requests when many accounts poll at once
+SEM = asyncio.Semaphore(int(os.getenv("TWAPI_CONCURRENT", "20")))
+
+# twitterapi.io allows 20 QPS paid / 0.2 QPS free trial. Pace requests
+# proactively instead of reacting to 429s after the fact. Rate is slightly
+# under the ceiling to absorb clock skew.
+TWAPI_QPS = float(os.getenv("TWAPI_QPS", "20"))
+RATE = AsyncLimiter(max_rate=TWAPI_QPS * 0.95, time_period=1)
+
+# Time format Twitter's API expects, hoisted so it isn't rebuilt per poll.
+# Only the first check per account needs it — afterwards the since_id
+# sentinel makes the query a constant string.
+TIME_FMT = "%Y-%m-%d_%H:%M:%S_UTC"
+
+# Per-account last-checked time; first check looks back one hour
+_last_checked_time: dict[str, datetime] = {}
+
+# Per-account newest tweet id already seen. Once set, we query with
+# since_id and treat that tweet as the end-of-pagination sentinel, which
+# skips both the boundary-tweet refetch and the final empty-page probe.
+_last_seen_id: dict[str, str] = {}
+
+
+async def check_for_new_tweets(session: aiohttp.ClientSession, account: str):
+    # timezone-aware now (datetime.utcnow is deprecated in 3.12)
+    until_time = datetime.now(timezone.utc)
+    last_seen_id = _last_seen_id.get(account)
+
+    if last_seen_id:
+        # Sentinel path: everything newer than the last tweet we processed
+        query = f"from:{account} since_id:{last_seen_id} include:nativeretweets"
+    else:
+        # First check: fall back to a one-hour time window
+        since_time = _last_checked_time.get(account, until_time - timedelta(hours=1))
+
+        # Format times as strings in the format Twitter's API expects
+        since_str = since_time.strftime(TIME_FMT)
+        until_str = until_time.strftime(TIME_FMT)
+
+        query = f"from:{account} since:{since_str} until:{until_str} include:nativeretweets"
+    # Please refer to this document for detailed Twitter advanced search syntax.
     # https://github.com/igorbrigadir/twitter-advanced-search
-    
+
     # API endpoint
     url = "https://api.twitterapi.io/twitter/tweet/advanced_search"
-    
+
     # Request parameters
     params = {
         "query": query,
         "queryType": "Latest"
     }
-    
+
     # Headers with API key
     headers = {
         "x-api-key": API_KEY  # Note: using lowercase as per your existing script
     }
-    
+
     # Make the request and handle pagination
     all_tweets = []
     next_cursor = None
-    
+
     while True:
         # Add cursor to params if we have one
         if next_cursor:
             params["cursor"] = next_cursor
-            
-        response = requests.get(url, headers=headers, params=params)
-        
+
+        async with SEM, RATE:
+            async with session.get(url, headers=headers, params=params) as response:
+                status = response.status
+                if status == 200:
+                    data = await response.json()
+                else:
+                    body = await response.text()
+
         # Parse the response
-        if response.status_code == 200:
-            data = response.json()
+        if status == 200:
             tweets = data.get("tweets", [])
-            
-            if tweets:
-                all_tweets.extend(tweets)
-            
+            hit_sentinel = False
+
+            for tweet in tweets:
+                # since_id is inclusive: the sentinel tweet marks the end
+                # of new results, so stop paging as soon as we see it
+                if last_seen_id and tweet.get("id") == last_seen_id:
+                    hit_sentinel = True
+                    break
+                all_tweets.append(tweet)
+
+            if hit_sentinel:
+                break
+
             # Check if there are more pages
-            if data.get("has_next_page", False) and data.get("next_cursor","") != "":
+            if data.get("has_next_page", False) and data.get("next_cursor", "") != "":
                 next_cursor = data.get("next_cursor")
                 continue
             else:
                 break
         else:
-            print(f"Error: {response.status_code} - {response.text}")
+            print(f"Error: {status} - {body}")
             break
-            
+
     # Process all collected tweets
     if all_tweets:
-        print(f"Found {len(all_tweets)} total tweets from {TARGET_ACCOUNT}!")
+        print(f"Found {len(all_tweets)} total tweets from {account}!")
         for tweet in all_tweets:
             print(f"[{tweet['createdAt']}] {tweet['text']}")
             # Here you could send notifications, save to database, etc.
+        # Remember the newest tweet (results come newest-first)
+        _last_seen_id[account] = all_tweets[0].get("id")
     else:
-        print(f"No new tweets from {TARGET_ACCOUNT} since last check.")
-    
+        print(f"No new tweets from {account} since last check.")
+
     # Update the last checked time
-    LAST_CHECKED_TIME = until_time
+    _last_checked_time[account] = until_time
+
+
+async def monitor(session: aiohttp.ClientSession, account: str):
+    """Poll one account forever on a drift-free schedule."""
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    while True:
+        await check_for_new_tweets(session, account)
+        # Schedule off absolute tick times so the interval doesn't drift
+        # by however long the check itself took
+        next_tick += CHECK_INTERVAL
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+async def main_async():
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(monitor(session, account) for account in TARGET_ACCOUNTS))
+
 
 # Main monitoring loop
 def main():
-    print(f"Starting to monitor tweets from @{TARGET_ACCOUNT}")
+    print(f"Starting to monitor tweets from: {', '.join('@' + a for a in TARGET_ACCOUNTS)}")
     print(f"Checking every {CHECK_INTERVAL} seconds")
-    
+
     try:
-        while True:
-            check_for_new_tweets()
-            time.sleep(CHECK_INTERVAL)
+        asyncio.run(main_async())
     except KeyboardInterrupt:
         print("Monitoring stopped.")
 
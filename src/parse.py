@@ -1,26 +1,37 @@
 import re
 from typing import Optional
+import numpy as np
 import pandas as pd
 
+# Compiled once: skips the re module's per-call cache lookup
+_USERNAME_RE = re.compile(r'@(\w+)')
+
+
 def extract_first_username(text, custom_message: Optional[str] = None):
     """
     Extract the first @username from tweet text.
     Returns the username without the @ symbol, or None if no username found.
 
-    If username None, in practice, this is a result of a thread to your own original post. 
+    If username None, in practice, this is a result of a thread to your own original post.
     """
     if not isinstance(text, str):
         return None
-    
-    # Find all @usernames in the text
-    usernames = re.findall(r'@(\w+)', text)
 
-    if usernames: 
-        return usernames[0]
-    else:
-        # No username found. Usually a result of a thread to your own original post. 
-        print(f"No username found in text: {text}")
-        return custom_message
+    # .search stops at the first hit instead of scanning the whole text
+    # like findall did. No print on the miss path — this gets called from
+    # DataFrame .apply over thousands of rows.
+    m = _USERNAME_RE.search(text)
+    return m.group(1) if m else custom_message
+
+
+def extract_first_usernames(series: pd.Series) -> pd.Series:
+    """
+    Vectorized variant for a whole column of tweet texts.
+
+    Runs the match in pandas' string kernel instead of one Python call
+    per row; misses come back as NaN.
+    """
+    return series.str.extract(r'@(\w+)', expand=False)
 
 
 
@@ -35,20 +46,29 @@ def classify_by_engagement_quantile(df, username_col, target_col, bins=5):
     - target_col: Column name for engagement metric to classify by
     - bins: Number of quantile bins (3-10)
     """
-    # Create quantile-based bins
-    df[f'{target_col}_category'] = pd.qcut(
-        df[target_col], 
-        q=bins, 
-        labels=[f'Q{i+1}' for i in range(bins)],
-        duplicates='drop'  # Handle duplicate values
-    )
-    
-    # Create more descriptive labels
-    category_mapping = {
-        f'Q{i+1}': f'Q{i+1}' for i in range(bins)
-    }
-    
-    df[f'{target_col}_category'] = df[f'{target_col}_category'].map(category_mapping)
+    # Compute bin edges with np.nanquantile + assign labels with
+    # np.searchsorted. Much faster than pd.qcut, which builds a Categorical
+    # and maps labels in pure Python. nanquantile keeps NaN rows from
+    # poisoning the edges, and np.unique handles duplicate edges (qcut's
+    # duplicates='drop').
+    vals = df[target_col].to_numpy(dtype=np.float64, copy=False)
+    edges = np.unique(np.nanquantile(vals, np.linspace(0, 1, bins + 1)))
+
+    # All-NaN or constant columns collapse to a single edge: no bins exist,
+    # which under qcut meant an all-null category column
+    if len(edges) < 2:
+        df[f'{target_col}_category'] = None
+        return df
+
+    idx = np.searchsorted(edges[1:-1], vals, side='right')
+    labels = np.array([f'Q{i+1}' for i in range(len(edges) - 1)])
+
+    # NaN sorts past every edge, so mask those rows back to a null category
+    # like qcut produced instead of letting them land in the top bin
+    categories = labels[idx].astype(object)
+    categories[np.isnan(vals)] = None
+
+    df[f'{target_col}_category'] = categories
     return df
 
 
@@ -68,14 +88,19 @@ def classify_by_cumsum_auto(df, username_col, target_col, n_categories=4):
     - target_col: Column name for engagement metric to classify by
     - n_categories: Number of categories to create
     """
-    # Sort by target column in descending order
-    df_sorted = df.sort_values(target_col, ascending=False).copy()
-    
-    # Calculate cumulative sum and percentage
-    df_sorted['cumsum'] = df_sorted[target_col].cumsum()
-    total_sum = df_sorted[target_col].sum()
-    df_sorted['cumsum_percent'] = df_sorted['cumsum'] / total_sum
-    
+    # Sort by target column in descending order (sort_values already returns
+    # a new frame, no extra .copy() needed)
+    df_sorted = df.sort_values(target_col, ascending=False, kind='stable')
+
+    # Cumulative sum stays in absolute units; instead of dividing the whole
+    # vector by the total we scale the few percentile breakpoints up by it.
+    # nancumsum/nansum skip NaNs like the pandas ops they replaced — a
+    # plain cumsum would turn one NaN into NaN thresholds and silently
+    # drop every row into the first bucket.
+    vals = df_sorted[target_col].to_numpy(dtype=np.float64, copy=False)
+    cum = np.nancumsum(vals)
+    total = np.nansum(vals)
+
     # Find natural breakpoints (where cumulative percentage changes significantly)
     if n_categories == 3:
         percentiles = [0.5, 0.8, 1.0]  # Top 50%, 50-80%, 80-100%
@@ -87,23 +112,23 @@ def classify_by_cumsum_auto(df, username_col, target_col, n_categories=4):
         # Create evenly spaced percentiles
         percentiles = [i/n_categories for i in range(1, n_categories+1)]
     
-    # Create conditions and labels
-    conditions = []
+    # Build labels
     labels = []
-    
     for i, percentile in enumerate(percentiles):
         if i == 0:
-            conditions.append(df_sorted['cumsum_percent'] <= percentile)
             labels.append(f'Top-{int(percentile*100)}%')
         else:
-            prev_percentile = percentiles[i-1]
-            conditions.append(
-                (df_sorted['cumsum_percent'] > prev_percentile) & 
-                (df_sorted['cumsum_percent'] <= percentile)
-            )
-            labels.append(f'{int(prev_percentile*100)}%-{int(percentile*100)}%')
-    
-    # Apply classification
-    df_sorted[f'{target_col}_category'] = np.select(conditions, labels, default='Bottom')
-    
+            labels.append(f'{int(percentiles[i-1]*100)}%-{int(percentile*100)}%')
+
+    # The cumulative sum is monotonic after the sort, so one binary search
+    # per element replaces the old np.select over n_categories boolean masks
+    thresholds = np.asarray(percentiles) * total
+    idx = np.searchsorted(thresholds, cum, side='left').clip(0, len(thresholds) - 1)
+
+    # NaN rows matched no np.select condition before and fell through to
+    # the 'Bottom' default; keep that label for them
+    categories = np.array(labels, dtype=object)[idx]
+    categories[np.isnan(vals)] = 'Bottom'
+    df_sorted[f'{target_col}_category'] = categories
+
     return df_sorted
\ No newline at end of file
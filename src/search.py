@@ -1,17 +1,126 @@
-import requests
-import time
-from typing import List, Dict
+import asyncio
+import aiofiles
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
+from typing import List, Dict, Optional
 from dotenv import load_dotenv, find_dotenv
 import os
 
+try:
+    import redis  # optional: enables a cross-process result cache
+except ImportError:
+    redis = None
+
 load_dotenv(find_dotenv())  # reliably loads .env from project root
 
 api_key = os.getenv("twitterapiio_key")
 if not api_key:
     raise RuntimeError("TWITTER_API_KEY not set in environment")
 
+# Max simultaneous in-flight requests when fanning out across handles.
+# This is only the starting point: the limit adapts AIMD-style (halve on
+# 429, widen by 1 after a streak of successes) toward the real ceiling.
+CONCURRENT_LIMIT = int(os.getenv("TWAPI_CONCURRENT", "20"))
+
+# Consecutive 2xx responses required before widening the limit again
+_SUCCESS_STREAK_TO_WIDEN = 20
+
+# Outbound QPS ceiling. twitterapi.io allows 20 QPS paid / 0.2 QPS free trial.
+# Nominal rate is set slightly below the ceiling to absorb clock skew.
+TWAPI_QPS = float(os.getenv("TWAPI_QPS", "20"))
+
+# Short TTL for the optional Redis result cache: repeated pulls for the
+# same handle within the window cost a hash lookup instead of an API
+# round trip + rate-limit budget
+REDIS_TTL = int(os.getenv("TWAPI_CACHE_TTL", "60"))
+_redis_client = None
+
+# Shared client session. Created lazily because aiohttp wants the session
+# built inside a running event loop.
+_session: Optional[aiohttp.ClientSession] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_rate_limiter: Optional[AsyncLimiter] = None
+_current_limit = CONCURRENT_LIMIT
+_success_streak = 0
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=64)
+        )
+    return _session
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(_current_limit)
+    return _semaphore
+
+
+def _record_rate_limited():
+    """Halve the concurrency limit after a 429 (multiplicative decrease)."""
+    global _semaphore, _current_limit, _success_streak
+    _current_limit = max(1, _current_limit // 2)
+    _success_streak = 0
+    _semaphore = asyncio.Semaphore(_current_limit)
+
+
+def _record_success():
+    """Widen the concurrency limit by 1 after a sustained success streak."""
+    global _semaphore, _current_limit, _success_streak
+    _success_streak += 1
+    if _success_streak >= _SUCCESS_STREAK_TO_WIDEN and _current_limit < CONCURRENT_LIMIT:
+        _current_limit += 1
+        _success_streak = 0
+        _semaphore = asyncio.Semaphore(_current_limit)
 
-def fetch_all_tweets(query: str, api_key: str, max_results: int | None = None) -> List[Dict]:
+
+def _get_rate_limiter() -> AsyncLimiter:
+    global _rate_limiter
+    if _rate_limiter is None:
+        # Run at 95% of the configured ceiling so we never trip the server limit
+        _rate_limiter = AsyncLimiter(max_rate=TWAPI_QPS * 0.95, time_period=1)
+    return _rate_limiter
+
+
+def _get_redis():
+    """Connect lazily; returns None when redis isn't installed/reachable."""
+    global _redis_client
+    if redis is None:
+        return None
+    if _redis_client is None:
+        try:
+            _redis_client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost"))
+            _redis_client.ping()
+        except Exception:
+            _redis_client = None
+            return None
+    return _redis_client
+
+
+async def close_session():
+    """Close the shared aiohttp session (call once when done fetching)."""
+    global _session, _semaphore, _rate_limiter
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    # The semaphore and limiter bind to the loop they were first awaited
+    # on; drop them with the session so the next asyncio.run gets fresh
+    # ones instead of aiolimiter's cross-loop reuse warning
+    _semaphore = None
+    _rate_limiter = None
+
+
+async def fetch_all_tweets(
+    query: str,
+    api_key: str,
+    max_results: int | None = None,
+    queue: Optional[asyncio.Queue] = None,
+) -> List[Dict]:
     """
     Fetches all tweets matching the given query from Twitter API, handling deduplication.
 
@@ -28,15 +137,24 @@ def fetch_all_tweets(query: str, api_key: str, max_results: int | None = None) -
         - Implements rate limiting handling
         - Continues fetching beyond Twitter's initial 800-1200 tweet limit
         - Includes error handling for API failures
+        - Async: retries/backoff use asyncio.sleep so other coroutines keep running,
+          and many handles can be fetched concurrently (see fetch_many_user_tweets)
+        - When `queue` is given, tweets are pushed onto it as they arrive
+          instead of accumulated in memory (see stream_tweets_to_jsonl)
     """
     base_url = "https://api.twitterapi.io/twitter/tweet/advanced_search"
     headers = {"x-api-key": api_key}
     all_tweets = []
     seen_tweet_ids = set()  # Set to track unique tweet IDs
+    collect = queue is None  # streaming mode keeps only ids in memory
+    total = 0
     cursor = None
     last_min_id = None
     max_retries = 3
 
+    session = _get_session()
+    rate_limiter = _get_rate_limiter()
+
     while True:
         # Prepare query parameters
         params = {
@@ -53,39 +171,70 @@ def fetch_all_tweets(query: str, api_key: str, max_results: int | None = None) -
 
         retry_count = 0
         while retry_count < max_retries:
+            status_code = None
             try:
-                # Make API request
-                response = requests.get(base_url, headers=headers, params=params)
-                response.raise_for_status()  # Raise exception for bad status codes
-                data = response.json()
+                # Make API request (semaphore caps total in-flight requests,
+                # rate limiter paces us under the API QPS ceiling). Re-fetch
+                # the semaphore each time: AIMD adjustments swap it out.
+                async with _get_semaphore():
+                    async with rate_limiter:
+                        async with session.get(base_url, headers=headers, params=params) as response:
+                            status_code = response.status
+                            remaining = response.headers.get("X-RateLimit-Remaining")
+                            reset = response.headers.get("X-RateLimit-Reset")
+                            response.raise_for_status()  # Raise exception for bad status codes
+                            # orjson parses the raw bytes much faster than
+                            # the stdlib json path behind response.json()
+                            data = orjson.loads(await response.read())
+
+                _record_success()
+
+                # Back off proactively when the server says quota is nearly gone,
+                # instead of waiting to eat a 429 penalty
+                if remaining is not None and remaining.isdigit() and int(remaining) <= 1:
+                    wait = float(reset) if reset else 1.0
+                    await asyncio.sleep(min(wait, 5.0))
 
                 # Extract tweets and metadata
                 tweets = data.get("tweets", [])
                 has_next_page = data.get("has_next_page", False)
                 cursor = data.get("next_cursor", None)
 
-                # Filter out duplicate tweets
-                new_tweets = [tweet for tweet in tweets if tweet.get("id") not in seen_tweet_ids]
-                
-                # Add new tweet IDs to the set and tweets to the collection
-                for tweet in new_tweets:
-                    seen_tweet_ids.add(tweet.get("id"))
-                    all_tweets.append(tweet)
+                # Filter out duplicates, record ids, and collect — all in one
+                # pass (locals aliased to skip attribute lookups in the loop)
+                seen = seen_tweet_ids
+                add = seen.add
+                append = all_tweets.append
+                new_count = 0
+                for tweet in tweets:
+                    tid = tweet.get("id")
+                    if tid in seen:
+                        continue
+                    add(tid)
+                    if collect:
+                        append(tweet)
+                    else:
+                        await queue.put(tweet)
+                    total += 1
+                    new_count += 1
+                    last_new_id = tid
+                    if max_results is not None and total >= max_results:
+                        break
 
                 # Respect max_results if provided (useful for quick tests)
-                if max_results is not None and len(all_tweets) >= max_results:
+                if max_results is not None and total >= max_results:
                     return all_tweets[:max_results]
 
                 # If no new tweets and no next page, break the loop
-                if not new_tweets and not has_next_page:
+                if new_count == 0 and not has_next_page:
                     return all_tweets
 
-                # Update last_min_id from the last tweet if available
-                if new_tweets:
-                    last_min_id = new_tweets[-1].get("id")
+                # Update last_min_id from the last new tweet if available
+                if new_count:
+                    last_min_id = last_new_id
 
                 # If no next page but we have new tweets, try with max_id
-                if not has_next_page and new_tweets:
+                if not has_next_page and new_count:
                     cursor = None  # Reset cursor for max_id pagination
                     break
 
@@ -93,27 +242,82 @@ def fetch_all_tweets(query: str, api_key: str, max_results: int | None = None) -
                 if has_next_page:
                     break
 
-            except requests.exceptions.RequestException as e:
+            except aiohttp.ClientError as e:
                 retry_count += 1
                 if retry_count == max_retries:
                     print(f"Failed to fetch tweets after {max_retries} attempts: {str(e)}")
                     return all_tweets
 
                 # Handle rate limiting
-                if hasattr(response, 'status_code') and response.status_code == 429:
+                if status_code == 429:
+                    _record_rate_limited()
                     #For users in the free trial period, the QPS is very low—only one API request can be made every 5 seconds. Once you complete the recharge, the QPS limit will be increased to 20.
                     print("Rate limit reached. Waiting for 1 second...")
-                    time.sleep(1)  # Wait 1 second for rate limit reset
+                    await asyncio.sleep(1)  # Wait 1 second for rate limit reset
                 else:
                     print(f"Error occurred: {str(e)}. Retrying {retry_count}/{max_retries}")
-                    time.sleep(2 ** retry_count)  # Exponential backoff
+                    await asyncio.sleep(2 ** retry_count)  # Exponential backoff
 
         # If no more pages and no new tweets with max_id, we're done
-        if not has_next_page and not new_tweets:
+        if not has_next_page and new_count == 0:
             break
 
     return all_tweets
 
+
+# End-of-stream marker for the JSONL writer task
+_SENTINEL = object()
+
+
+async def _jsonl_writer(queue: asyncio.Queue, path: str) -> int:
+    """Single-writer consumer: drain the queue into a JSONL file."""
+    written = 0
+    async with aiofiles.open(path, "wb") as f:
+        while True:
+            tweet = await queue.get()
+            if tweet is _SENTINEL:
+                break
+            await f.write(orjson.dumps(tweet) + b"\n")
+            written += 1
+    return written
+
+
+async def stream_tweets_to_jsonl(
+    query: str,
+    api_key: str,
+    path: str = "tweets.jsonl",
+    max_results: int | None = None,
+) -> int:
+    """
+    Fetch tweets and stream them to a JSONL file as they arrive.
+
+    Producers push tweets onto a bounded queue while a single writer task
+    serializes them line by line, so memory stays bounded regardless of
+    pull size, serialization overlaps with network I/O, and a killed run
+    leaves a resumable file behind.
+
+    Returns:
+        int: number of tweets written
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+    writer = asyncio.create_task(_jsonl_writer(queue, path))
+    try:
+        await fetch_all_tweets(query, api_key, max_results=max_results, queue=queue)
+    finally:
+        await queue.put(_SENTINEL)
+    return await writer
+
+
+def fetch_all_tweets_sync(query: str, api_key: str, max_results: int | None = None) -> List[Dict]:
+    """Blocking wrapper around fetch_all_tweets for callers without an event loop."""
+    async def _run():
+        try:
+            return await fetch_all_tweets(query, api_key, max_results=max_results)
+        finally:
+            await close_session()
+    return asyncio.run(_run())
+
+
 # Convenience: fetch tweets by user handle
 def fetch_user_tweets(user_handle: str, api_key: str, max_results: int = 10) -> List[Dict]:
     """
@@ -127,30 +331,64 @@ def fetch_user_tweets(user_handle: str, api_key: str, max_results: int = 10) ->
     if user_handle.startswith("@"):
         user_handle = user_handle[1:]
     query = f"from:{user_handle}"
-    return fetch_all_tweets(query, api_key, max_results=max_results)
+
+    # Serve from Redis when available — turns a repeat pull within the TTL
+    # into a memory-speed lookup instead of a network RTT + quota hit
+    r = _get_redis()
+    key = f"twapi:{user_handle}:{max_results}"
+    if r is not None:
+        try:
+            cached = r.get(key)
+        except Exception:
+            cached = None
+        if cached:
+            return orjson.loads(cached)
+
+    tweets = fetch_all_tweets_sync(query, api_key, max_results=max_results)
+
+    if r is not None and tweets:
+        try:
+            r.setex(key, REDIS_TTL, orjson.dumps(tweets))
+        except Exception:
+            pass
+    return tweets
+
+
+async def fetch_many_user_tweets(user_handles: List[str], api_key: str, max_results: int = 10) -> Dict[str, List[Dict]]:
+    """
+    Fan out fetches across many handles concurrently (bounded by CONCURRENT_LIMIT).
+
+    Returns:
+        Dict mapping handle -> list of tweets
+    """
+    handles = [h[1:] if h.startswith("@") else h for h in user_handles]
+    results = await asyncio.gather(
+        *(fetch_all_tweets(f"from:{h}", api_key, max_results=max_results) for h in handles)
+    )
+    return dict(zip(handles, results))
+
 
 # Example usage
 if __name__ == "__main__":
     # Example 1: query by keywords
     query = "python programming"
 
-    # Retrieving all tweets from a specific account within a specified time period.and you can also filter data based on the number of likes. 
+    # Retrieving all tweets from a specific account within a specified time period.and you can also filter data based on the number of likes.
     # For the usage of query parameters, please refer to the relevant documentation.
-    # https://github.com/igorbrigadir/twitter-advanced-search 
+    # https://github.com/igorbrigadir/twitter-advanced-search
     #query = "from:elonmusk since:2009-01-01 until:2019-01-01 min_faves:10"
-    
+
     #
 
     # Quick test: limit to 10 results
-    # tweets = fetch_all_tweets(query, api_key, max_results=10)
+    # tweets = fetch_all_tweets_sync(query, api_key, max_results=10)
 
     # Example 2: fetch by user handle (max 10 by default)
     handle = "ern1337"
     tweets = fetch_user_tweets(handle, api_key)  # defaults to 10
-    
+
     print(f"Fetched {len(tweets)} unique tweets")
-    
+
     # Save to file
-    import json
-    with open('tweets1.json', 'w') as f:
-        json.dump(tweets, f, indent=2)
+    with open('tweets1.json', 'wb') as f:
+        f.write(orjson.dumps(tweets, option=orjson.OPT_INDENT_2))
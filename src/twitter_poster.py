@@ -28,6 +28,11 @@ class TwitterPoster:
             "X-API-Key": self.api_key,
             "Content-Type": "application/json"
         }
+
+        # One persistent session for all calls: keeps the TCP+TLS connection
+        # alive across login/post requests instead of re-handshaking each time
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def login_simple(self, max_retries: int = 3) -> bool:
         """
@@ -46,7 +51,7 @@ class TwitterPoster:
             }
             
             try:
-                response = requests.post(url, headers=self.headers, json=payload, proxies=self.proxy)
+                response = self.session.post(url, json=payload, proxies=self.proxy)
                 response.raise_for_status()
                 
                 data = response.json()
@@ -119,7 +124,7 @@ class TwitterPoster:
             payload["attachment_url"] = attachment_url
         
         try:
-            response = requests.post(url, headers=self.headers, json=payload, proxies=self.proxy)
+            response = self.session.post(url, json=payload, proxies=self.proxy)
             response.raise_for_status()
             
             data = response.json()
@@ -1,27 +1,218 @@
+import functools
+import gzip
+import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import json
 import hashlib
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import find_dotenv, load_dotenv
 
-# Load environment variables
-load_dotenv(find_dotenv())
+try:
+    import orjson  # much faster cache (de)serialization when available
+except ImportError:
+    orjson = None
 
-API_KEY = os.getenv("twitterapiio_key")
-if not API_KEY:
-    raise RuntimeError("twitterapiio_key not set in environment")
+try:
+    import ijson  # streaming parse of large tweet caches when available
+except ImportError:
+    ijson = None
+
+# Cache hit/miss chatter goes to logging instead of print: print acquires
+# the stdout lock and flushes per call, which serializes workers under the
+# threaded batch helpers, and %-style args cost nothing when DEBUG is off
+logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.twitterapi.io"
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> Optional[str]:
+    """
+    Load .env and return the API key, once per process.
+
+    find_dotenv walks up the directory tree stat-ing each parent, so the
+    lookup is deferred until the first real request instead of running at
+    import time — importing this module for tests or linting stays free.
+    """
+    load_dotenv(find_dotenv(usecwd=True))
+    return os.getenv("twitterapiio_key")
+
+# Resolved once: Path.resolve() stats every path component, and cache
+# helpers run on every hit
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+JSONS_DIR = PROJECT_ROOT / "data" / "jsons"
+
+# One pooled session for every API call: pages after the first reuse the
+# TCP+TLS connection instead of re-handshaking, and transient 429/5xx
+# responses retry with backoff instead of aborting a whole pagination.
+SESSION = requests.Session()
+# Retry-After is honored explicitly so a 429's server-suggested wait wins
+# over the exponential schedule instead of hammering through it.
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+
+# (connect, read) timeouts so a stalled request can't hang a pagination
+REQUEST_TIMEOUT = (5, 30)
+
+
+# Caches are machine-read; compact output halves bytes written vs indent=2.
+# Set INDENT_CACHES=1 when a human needs to eyeball the files.
+INDENT_CACHES = os.getenv("INDENT_CACHES") == "1"
+
+# In-process memory tier fronting the disk caches: a repeat lookup for the
+# same query within one process skips the file read and JSON parse entirely.
+# Keyed by cache path, which is already unique per user/query/relation type
+# (username + query_hash alone would collide followings with followers).
+# Entries expire after CACHE_TTL seconds; CACHE_ENABLED=0 disables the tier.
+# Bounded at CACHE_MAX_ENTRIES with least-recently-used eviction so a batch
+# job over thousands of users can't grow the dict without limit.
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") != "0"
+CACHE_TTL = float(os.getenv("CACHE_TTL", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+_MEM_CACHE: Dict[str, Tuple[float, Dict]] = {}
+_MEM_CACHE_LOCK = threading.Lock()  # loads/saves may run from worker threads
+
+
+def _mem_cache_get(cache_path: str) -> Optional[Dict]:
+    """Return the cached payload for a path if present and fresh."""
+    if not CACHE_ENABLED:
+        return None
+    with _MEM_CACHE_LOCK:
+        entry = _MEM_CACHE.get(cache_path)
+        if entry is None:
+            return None
+        ts, data = entry
+        if time.monotonic() - ts >= CACHE_TTL:
+            del _MEM_CACHE[cache_path]
+            return None
+        # Re-insert so dict order tracks recency (dicts preserve insertion
+        # order, which makes the oldest key the LRU victim below)
+        del _MEM_CACHE[cache_path]
+        _MEM_CACHE[cache_path] = entry
+        return data
+
+
+def _mem_cache_put(cache_path: str, data: Dict) -> None:
+    """Write-through: remember a payload that was just saved or loaded."""
+    if not CACHE_ENABLED:
+        return
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE.pop(cache_path, None)
+        _MEM_CACHE[cache_path] = (time.monotonic(), data)
+        while len(_MEM_CACHE) > CACHE_MAX_ENTRIES:
+            # First key is the least recently touched
+            del _MEM_CACHE[next(iter(_MEM_CACHE))]
+
+
+def _dumps_cache(data: Dict) -> bytes:
+    """Serialize a cache payload to UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if INDENT_CACHES else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if INDENT_CACHES else None).encode("utf-8")
+
+
+def _loads_cache(raw: bytes) -> Dict:
+    """Parse a cache payload from bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_cache_file(cache_path: str, cache_data: Dict) -> None:
+    """
+    Commit a cache payload atomically: serialize to a sibling temp file,
+    then os.replace it onto the final path. Readers see either the old
+    complete file or the new one — a crash mid-write can no longer leave
+    a torn file that costs a full API re-fetch on the next load.
+    """
+    tmp = cache_path + ".tmp"
+    # compresslevel=1 costs little CPU and still shrinks the repetitive
+    # JSON field names ~4-8x — large limit=1000 caches go from MBs to KBs
+    with gzip.open(tmp, "wb", compresslevel=1) as f:
+        f.write(_dumps_cache(cache_data))
+    os.replace(tmp, cache_path)
+    _mem_cache_put(cache_path, cache_data)
+
+
+def _read_cache_file(cache_path: str) -> Optional[Dict]:
+    """
+    Load a cache payload through the memory tier.
+
+    Returns None for files too short to be valid JSON (truncated writes)
+    or with torn/garbled gzip content, so corruption degrades to a cache
+    miss for every caller instead of propagating. The gzip magic bytes
+    decide whether to decompress, so plain-JSON files written before
+    compression landed still parse.
+    """
+    cached_data = _mem_cache_get(cache_path)
+    if cached_data is not None:
+        return cached_data
+
+    with open(cache_path, "rb") as f:
+        raw = f.read()
+    # Valid JSON is at least 2 bytes ({}): skip the parse attempt on a
+    # zero/one-byte file left behind by a crashed writer
+    if len(raw) < 2:
+        return None
+    if raw[:2] == b"\x1f\x8b":
+        # A truncated stream raises EOFError, a garbled header BadGzipFile —
+        # neither is a ValueError, so they need their own corruption path
+        try:
+            raw = gzip.decompress(raw)
+        except (EOFError, gzip.BadGzipFile) as e:
+            logger.warning("Cache file corrupted: %s", e)
+            return None
+    cached_data = _loads_cache(raw)
+    _mem_cache_put(cache_path, cached_data)
+    return cached_data
+
+
+def _parse_response(resp) -> Dict:
+    """
+    Decode an API response body.
+
+    orjson parses the raw bytes directly, skipping the UTF-8 bytes->str
+    detour that requests' resp.json() takes before stdlib parsing.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
 def _headers(api_key: Optional[str] = None) -> Dict[str, str]:
-    key = api_key or API_KEY
+    key = api_key or _load_env()
+    if not key:
+        # Raised here rather than at import so the missing key only bites
+        # when a request is actually attempted
+        raise RuntimeError("twitterapiio_key not set in environment")
     return {"X-API-Key": key}
 
 
+def _normalize_handle(username: str) -> str:
+    """Strip a leading @ and reject empty handles, in one place."""
+    if not username:
+        raise ValueError("username is required")
+    return username[1:] if username.startswith("@") else username
+
+
 def _followings_endpoint() -> str:
     return f"{BASE_URL}/twitter/user/followings"
 
@@ -35,7 +226,7 @@ def _fetch_user_relations(
     is_followings: bool,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """
@@ -46,15 +237,13 @@ def _fetch_user_relations(
         is_followings: True for followings, False for followers
         limit: Maximum number of relations to return
         api_key: Optional override of API key
-        page_size: Page size for each request (20-200)
+        page_size: Page size for each request (20-200); defaults to the API max so limit<=200 costs one round trip
         start_cursor: Optional starting cursor token
         
     Returns:
         Dict with keys: {followings|followers} (list), has_next_page (bool), next_cursor (str|None)
     """
-    if not username:
-        raise ValueError("username is required")
-    handle = username[1:] if username.startswith("@") else username
+    handle = _normalize_handle(username)
 
     # Clamp page_size per API constraints
     if page_size < 20:
@@ -70,29 +259,30 @@ def _fetch_user_relations(
     headers = _headers(api_key)
 
     collected: List[Dict] = []
+    n = 0  # tracked incrementally instead of len() per iteration
     cursor: Optional[str] = start_cursor or None
     has_next_page: bool = True
 
-    while has_next_page and len(collected) < limit:
-        params = {"userName": handle, "pageSize": page_size}
-        if cursor is not None:
-            # First page can be "" or omitted. If explicitly provided, pass it through.
-            if cursor == "":
-                # Ensure we don't send stale value from previous iteration
-                params.pop("cursor", None)
-            else:
-                params["cursor"] = cursor
+    # Invariant query string encoded once; only the cursor changes per page,
+    # so requests' per-call params-dict walk and re-quoting are skipped.
+    # First page can be "" or omitted — both fall through to the base URL.
+    base_url = f"{url}?userName={quote(handle)}&pageSize={page_size}"
+
+    while has_next_page and n < limit:
+        full_url = base_url if not cursor else f"{base_url}&cursor={quote(cursor)}"
 
-        resp = requests.get(url, headers=headers, params=params)
+        resp = SESSION.get(full_url, headers=headers, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = _parse_response(resp)
 
         page_data = data.get(data_key, [])
-        remaining = max(0, limit - len(collected))
+        remaining = limit - n
         if remaining <= 0:
             break
         if page_data:
-            collected.extend(page_data[:remaining])
+            # islice caps the extend without allocating a sliced copy
+            collected.extend(islice(page_data, remaining))
+            n = len(collected)
 
         has_next_page = bool(data.get("has_next_page"))
         cursor = data.get("next_cursor") if has_next_page else None
@@ -100,9 +290,6 @@ def _fetch_user_relations(
         if not page_data:
             break
 
-    # Trim to limit
-    collected = collected[:limit]
-
     return {
         "has_next_page": has_next_page,
         "next_cursor": cursor,
@@ -116,7 +303,7 @@ def get_recent_followings(
     username: str,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """
@@ -126,7 +313,7 @@ def get_recent_followings(
         username: Twitter handle (with or without leading @)
         limit: Maximum number of followings to return
         api_key: Optional override of API key
-        page_size: Page size for each request (20-200)
+        page_size: Page size for each request (20-200); defaults to the API max so limit<=200 costs one round trip
         start_cursor: Optional starting cursor token (first page is empty string or omitted)
 
     Returns:
@@ -146,20 +333,20 @@ def get_recent_followers(
     username: str,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """
     Fetch user followers sorted by follow date (most recent first).
     
-    Identical to get_followings() but uses the followers endpoint.
+    Identical to get_recent_followings() but uses the followers endpoint.
     Returns recent followers with pagination support for caching/resuming.
 
     Args:
         username: Twitter handle (with or without leading @)
         limit: Maximum number of followers to return
         api_key: Optional override of API key
-        page_size: Page size for each request (20-200)
+        page_size: Page size for each request (20-200); defaults to the API max so limit<=200 costs one round trip
         start_cursor: Optional starting cursor token (first page is empty string or omitted)
 
     Returns:
@@ -172,32 +359,227 @@ def get_recent_followers(
         - Cost control: limit pages to control API usage
     """
     return _fetch_user_relations(
-        username, 
-        is_followings=False, 
-        limit=limit, 
-        api_key=api_key, 
-        page_size=page_size, 
+        username,
+        is_followings=False,
+        limit=limit,
+        api_key=api_key,
+        page_size=page_size,
         start_cursor=start_cursor
     )
 
+
+# Shared by all async paginations in the process; created lazily on first
+# use so they bind to the running event loop (same pattern as src/search.py).
+# The limiter paces slightly under the twitterapi.io QPS ceiling and the
+# semaphore bounds in-flight requests during wide multi-user gathers.
+# Both bind to the loop they first await on, so a loop change (each
+# asyncio.run creates a fresh one) discards them and rebuilds.
+_ASYNC_LIMITER = None
+_ASYNC_SEMAPHORE = None
+_ASYNC_LOOP = None
+
+
+def _check_async_loop() -> None:
+    """Drop loop-bound primitives when called under a new event loop."""
+    global _ASYNC_LIMITER, _ASYNC_SEMAPHORE, _ASYNC_LOOP
+    import asyncio
+    loop = asyncio.get_running_loop()
+    if loop is not _ASYNC_LOOP:
+        _ASYNC_LOOP = loop
+        _ASYNC_LIMITER = None
+        _ASYNC_SEMAPHORE = None
+
+
+def _get_async_limiter():
+    global _ASYNC_LIMITER
+    _check_async_loop()
+    if _ASYNC_LIMITER is None:
+        from aiolimiter import AsyncLimiter
+        qps = float(os.getenv("TWAPI_QPS", "20"))
+        _ASYNC_LIMITER = AsyncLimiter(max_rate=qps * 0.95, time_period=1)
+    return _ASYNC_LIMITER
+
+
+def _get_async_semaphore():
+    global _ASYNC_SEMAPHORE
+    _check_async_loop()
+    if _ASYNC_SEMAPHORE is None:
+        import asyncio
+        _ASYNC_SEMAPHORE = asyncio.Semaphore(int(os.getenv("TWAPI_CONCURRENT", "16")))
+    return _ASYNC_SEMAPHORE
+
+
+async def _fetch_user_relations_async(
+    username: str,
+    is_followings: bool,
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    start_cursor: Optional[str] = None,
+    session: Optional["aiohttp.ClientSession"] = None,
+) -> Dict:
+    """
+    Async counterpart of _fetch_user_relations.
+
+    The API's cursors are strictly sequential, so pages for one user still
+    arrive in order — the win is fanning out across many users with
+    asyncio.gather while each pagination's network wait overlaps the rest:
+
+        results = await asyncio.gather(
+            *(get_recent_followings_async(u) for u in users)
+        )
+    """
+    import aiohttp  # local import: async path is optional for sync callers
+
+    handle = _normalize_handle(username)
+
+    if page_size < 20:
+        page_size = 20
+    if page_size > 200:
+        page_size = 200
+
+    url = _followings_endpoint() if is_followings else _followers_endpoint()
+    data_key = "followings" if is_followings else "followers"
+    relation_type = "followings" if is_followings else "followers"
+
+    headers = _headers(api_key)
+
+    own_session = session is None
+    if own_session:
+        # limit_per_host matches the fan-out pattern: many users share the
+        # one host, so the connector caps sockets rather than the gather
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64)
+        )
+
+    collected: List[Dict] = []
+    cursor: Optional[str] = start_cursor or None
+    has_next_page: bool = True
+
+    # Built once and mutated per page: only the cursor ever changes
+    params = {"userName": handle, "pageSize": page_size}
+
+    try:
+        while has_next_page and len(collected) < limit:
+            if cursor:
+                params["cursor"] = cursor
+            else:
+                params.pop("cursor", None)
+
+            async with _get_async_semaphore(), _get_async_limiter():
+                async with session.get(url, headers=headers, params=params) as resp:
+                    resp.raise_for_status()
+                    data = await resp.json()
+
+            page_data = data.get(data_key, [])
+            remaining = max(0, limit - len(collected))
+            if remaining <= 0:
+                break
+            if page_data:
+                collected.extend(page_data[:remaining])
+
+            has_next_page = bool(data.get("has_next_page"))
+            cursor = data.get("next_cursor") if has_next_page else None
+
+            if not page_data:
+                break
+    finally:
+        if own_session:
+            await session.close()
+
+    collected = collected[:limit]
+
+    return {
+        "has_next_page": has_next_page,
+        "next_cursor": cursor,
+        "status": "success",
+        "message": f"Fetched {len(collected)} {relation_type} for {handle}",
+        data_key: collected
+    }
+
+
+async def get_recent_followings_async(
+    username: str,
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    start_cursor: Optional[str] = None,
+    session=None,
+) -> Dict:
+    """Async get_recent_followings; pass a shared session when fanning out."""
+    return await _fetch_user_relations_async(
+        username,
+        is_followings=True,
+        limit=limit,
+        api_key=api_key,
+        page_size=page_size,
+        start_cursor=start_cursor,
+        session=session,
+    )
+
+
+async def get_recent_followers_async(
+    username: str,
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    start_cursor: Optional[str] = None,
+    session=None,
+) -> Dict:
+    """Async get_recent_followers; pass a shared session when fanning out."""
+    return await _fetch_user_relations_async(
+        username,
+        is_followings=False,
+        limit=limit,
+        api_key=api_key,
+        page_size=page_size,
+        start_cursor=start_cursor,
+        session=session,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _ensure_dir(path: str) -> Path:
+    """mkdir once per directory per process instead of a syscall per cache op."""
+    p = Path(path)
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
 def _follow_hash_cache_path(
     username: str, 
     query_hash: str, 
     is_followings: bool
 ) -> str:
-    """Generate organized cache path: jsons/{followings|followers}/{username}/{hash}.json"""
+    """Generate organized cache path: jsons/{followings|followers}/{username}/{hash}.json.gz"""
     safe_username = username.replace("@", "")
-    project_root = Path(__file__).resolve().parents[1]
     folder = "followings" if is_followings else "followers"
-    cache_dir = project_root / "data" / "jsons" / folder / safe_username
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return str(cache_dir / f"{query_hash}.json")
+    cache_dir = _ensure_dir(str(JSONS_DIR / folder / safe_username))
+    return str(cache_dir / f"{query_hash}.json.gz")
 
 
 def generate_follow_query_hash(username: str, limit: int, page_size: int, start_cursor: Optional[str] = None) -> str:
-    """Generate hash for follow query parameters."""
-    combined = f"user:{username}|limit:{limit}|page_size:{page_size}|cursor:{start_cursor or ''}"
-    return hashlib.md5(combined.encode()).hexdigest()[:12]
+    """
+    Generate hash for follow query parameters.
+
+    Deliberately excludes `limit`: the cache stores whatever prefix of the
+    relation list has been fetched so far, so asking for a larger limit
+    later reuses the cached prefix and resumes from its next_cursor
+    instead of re-fetching page 1. (`limit` stays in the signature for
+    call-site compatibility.)
+    """
+    # BLAKE2b at digest_size=6 gives the same 12-hex-char key as the old
+    # truncated MD5, but hashes faster and has no FIPS-mode restrictions.
+    # Fed incrementally with constant byte separators so no intermediate
+    # combined string is allocated per call.
+    h = hashlib.blake2b(digest_size=6)
+    h.update(b"user:")
+    h.update(username.encode())
+    h.update(b"|page_size:")
+    h.update(str(page_size).encode())
+    h.update(b"|cursor:")
+    h.update((start_cursor or "").encode())
+    return h.hexdigest()
 
 
 def save_follow_cache(
@@ -246,9 +628,8 @@ def save_follow_cache(
         "followings" if is_followings else "followers": data.get("followings" if is_followings else "followers", [])
     }
     
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, ensure_ascii=False, indent=2)
-    
+    _write_cache_file(cache_path, cache_data)
+
     return cache_path
 
 
@@ -262,26 +643,31 @@ def load_follow_cache(username: str, query_hash: str, is_followings: bool) -> Op
         is_followings: True for followings, False for followers
     """
     cache_path = _follow_hash_cache_path(username, query_hash, is_followings)
-    
-    if not os.path.exists(cache_path):
-        return None
-    
+
+    # No exists() probe: one open saves a stat syscall per lookup and
+    # avoids the check/open race under concurrent writers
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-        
-        # Return in the same format as get_recent_followings/followers
+        cached_data = _read_cache_file(cache_path)
+        if cached_data is None:
+            return None
+
+        # Return in the same format as get_recent_followings/followers.
+        # Pagination state lives under "metadata" where save_follow_cache
+        # puts it (the old top-level lookup always came back False/None).
+        meta = cached_data.get("metadata", {})
         data_key = "followings" if is_followings else "followers"
         return {
-            "has_next_page": cached_data.get("has_next_page", False),
-            "next_cursor": cached_data.get("next_cursor"),
+            "has_next_page": meta.get("has_next_page", False),
+            "next_cursor": meta.get("next_cursor"),
             "status": "success",
             "message": f"Loaded {len(cached_data.get(data_key, []))} {data_key} from cache",
             data_key: cached_data.get(data_key, [])
         }
         
-    except (json.JSONDecodeError, KeyError) as e:
-        print(f"❌ Cache file corrupted: {e}")
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError) as e:
+        logger.warning("Cache file corrupted: %s", e)
         return None
 
 
@@ -290,7 +676,7 @@ def _get_user_relations_cached(
     is_followings: bool,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """Internal function for cached user relations fetching."""
@@ -300,11 +686,49 @@ def _get_user_relations_cached(
     # Check cache first
     cached = load_follow_cache(username, query_hash, is_followings=is_followings)
     if cached:
-        print(f"✅ Cache hit: {len(cached[relation_type])} {relation_type}")
-        return cached
-    
+        items = cached[relation_type]
+
+        # Full hit: cached prefix covers the requested limit (or the
+        # relation list is exhausted and there's simply nothing more)
+        if len(items) >= limit or not cached.get("has_next_page"):
+            logger.debug("Cache hit: %d %s", min(len(items), limit), relation_type)
+            cached[relation_type] = items[:limit]
+            cached["message"] = f"Loaded {len(cached[relation_type])} {relation_type} from cache"
+            return cached
+
+        # Partial hit: serve the cached prefix and resume from its cursor
+        # for the remainder — only the missing pages cost API calls
+        logger.debug("Cache extend: have %d, fetching up to %d %s", len(items), limit, relation_type)
+        tail = _fetch_user_relations(
+            username,
+            is_followings=is_followings,
+            limit=limit - len(items),
+            api_key=api_key,
+            page_size=page_size,
+            start_cursor=cached.get("next_cursor"),
+        )
+        merged = items + tail.get(relation_type, [])
+        data = {
+            "has_next_page": tail.get("has_next_page", False),
+            "next_cursor": tail.get("next_cursor"),
+            "status": "success",
+            "message": f"Fetched {len(merged)} {relation_type} for {username}",
+            relation_type: merged,
+        }
+        save_follow_cache(
+            username,
+            query_hash,
+            is_followings=is_followings,
+            data=data,
+            limit=limit,
+            page_size=page_size,
+            start_cursor=start_cursor
+        )
+        logger.debug("Cached %d %s", len(merged), relation_type)
+        return data
+
     # Cache miss - fetch from API
-    print(f"🔄 Cache miss: fetching {relation_type} from API...")
+    logger.debug("Cache miss: fetching %s from API", relation_type)
     data = _fetch_user_relations(
         username, 
         is_followings=is_followings, 
@@ -324,7 +748,7 @@ def _get_user_relations_cached(
         page_size=page_size, 
         start_cursor=start_cursor
     )
-    print(f"💾 Cached {len(data.get(relation_type, []))} {relation_type}")
+    logger.debug("Cached %d %s", len(data.get(relation_type, [])), relation_type)
     return data
 
 
@@ -332,7 +756,7 @@ def get_recent_followings_cached(
     username: str,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """get_recent_followings with automatic caching."""
@@ -350,20 +774,82 @@ def get_recent_followers_cached(
     username: str,
     limit: int = 20,
     api_key: Optional[str] = None,
-    page_size: int = 20,
+    page_size: int = 200,
     start_cursor: Optional[str] = None,
 ) -> Dict:
     """get_recent_followers with automatic caching."""
     return _get_user_relations_cached(
-        username, 
-        is_followings=False, 
-        limit=limit, 
-        api_key=api_key, 
-        page_size=page_size, 
+        username,
+        is_followings=False,
+        limit=limit,
+        api_key=api_key,
+        page_size=page_size,
         start_cursor=start_cursor
     )
 
 
+def _get_many_user_relations_cached(
+    usernames: List[str],
+    is_followings: bool,
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    max_workers: int = 8,
+) -> Dict[str, Dict]:
+    """Fan _get_user_relations_cached out over a thread pool, one user each."""
+    def fetch(u: str) -> Dict:
+        return _get_user_relations_cached(
+            u, is_followings=is_followings, limit=limit,
+            api_key=api_key, page_size=page_size,
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(fetch, usernames))
+    return dict(zip(usernames, results))
+
+
+def get_many_recent_followings_cached(
+    usernames: List[str],
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    max_workers: int = 8,
+) -> Dict[str, Dict]:
+    """
+    get_recent_followings_cached for many users, fetched concurrently.
+
+    Same thread-pool fan-out as get_many_user_tweets_cached: the workload
+    is pure I/O, so N users cost roughly one user's latency up to
+    max_workers, and cache hits barely occupy a worker.
+
+    Returns:
+        Dict mapping each username to its get_recent_followings_cached result.
+    """
+    return _get_many_user_relations_cached(
+        usernames, is_followings=True, limit=limit,
+        api_key=api_key, page_size=page_size, max_workers=max_workers,
+    )
+
+
+def get_many_recent_followers_cached(
+    usernames: List[str],
+    limit: int = 20,
+    api_key: Optional[str] = None,
+    page_size: int = 200,
+    max_workers: int = 8,
+) -> Dict[str, Dict]:
+    """
+    get_recent_followers_cached for many users, fetched concurrently.
+
+    Returns:
+        Dict mapping each username to its get_recent_followers_cached result.
+    """
+    return _get_many_user_relations_cached(
+        usernames, is_followings=False, limit=limit,
+        api_key=api_key, page_size=page_size, max_workers=max_workers,
+    )
+
+
 
 
 # ---------------------------------
@@ -399,32 +885,34 @@ def search_tweets_advanced(
     headers = _headers(api_key)
 
     collected: List[Dict] = []
+    n = 0  # tracked incrementally instead of len() per iteration
     cursor: Optional[str] = start_cursor or None
     has_next_page: bool = True
 
-    while has_next_page and len(collected) < limit:
-        params: Dict[str, object] = {"query": query, "queryType": query_type}
-        if cursor:
-            params["cursor"] = cursor
+    # Invariant params built once; only the cursor changes per page
+    base_params: Dict[str, object] = {"query": query, "queryType": query_type}
+
+    while has_next_page and n < limit:
+        params = base_params if not cursor else {**base_params, "cursor": cursor}
 
-        resp = requests.get(url, headers=headers, params=params)
+        resp = SESSION.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = _parse_response(resp)
 
         page = data.get("tweets", [])
-        remaining = max(0, limit - len(collected))
+        remaining = limit - n
         if remaining <= 0:
             break
         if page:
-            collected.extend(page[:remaining])
+            # islice caps the extend without allocating a sliced copy
+            collected.extend(islice(page, remaining))
+            n = len(collected)
 
         has_next_page = bool(data.get("has_next_page"))
         cursor = data.get("next_cursor") if has_next_page else None
 
         if not page:
             break
-
-    collected = collected[:limit]
     return {
         "has_next_page": has_next_page,
         "next_cursor": cursor,
@@ -437,6 +925,46 @@ def search_tweets_advanced(
 # Specific wrapper (no cursor param)
 # ---------------------------------
 
+def _build_user_tweet_query(
+    handle: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_faves: Optional[int] = None,
+    include_replies: bool = True,
+) -> str:
+    """Assemble the advanced-search query string for one user's tweets."""
+    parts = [f"from:{handle}"]
+    if start_date:
+        parts.append(f"since:{start_date}")
+    if end_date:
+        parts.append(f"until:{end_date}")
+    if min_faves:
+        parts.append(f"min_faves:{min_faves}")
+    if not include_replies:
+        parts.append("-is:reply")
+    return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_query_and_hash(
+    handle: str,
+    limit: int,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    min_faves: Optional[int],
+    include_replies: bool,
+) -> Tuple[str, str]:
+    """
+    Memoized query string + cache key for one set of user-tweet args.
+
+    Repeat cached calls with the same arguments skip the join/encode/hash
+    work entirely — together with the memory tier that makes an in-process
+    repeat hit allocation-free.
+    """
+    query = _build_user_tweet_query(handle, start_date, end_date, min_faves, include_replies)
+    return query, generate_query_hash(query, limit)
+
+
 def get_user_tweets(
     api_key: str,
     username: str,
@@ -461,20 +989,8 @@ def get_user_tweets(
     Returns:
         Dict with keys: tweets (list), has_next_page (bool), next_cursor (str|None)
     """
-    # Normalize handle
-    handle = username[1:] if username.startswith("@") else username
-
-    parts = [f"from:{handle}"]
-    if start_date:
-        parts.append(f"since:{start_date}")
-    if end_date:
-        parts.append(f"until:{end_date}")
-    if min_faves:
-        parts.append(f"min_faves:{min_faves}")
-    if not include_replies:
-        parts.append("-is:reply")
-
-    query = " ".join(parts)
+    handle = _normalize_handle(username)
+    query = _build_user_tweet_query(handle, start_date, end_date, min_faves, include_replies)
 
     return search_tweets_advanced(
         query=query,
@@ -500,17 +1016,30 @@ def generate_query_hash(query: str, limit: int) -> str:
     Returns:
         str: EG: `56a894d2360a`
     """
-    combined = f"{query}|limit:{limit}"
-    return hashlib.md5(combined.encode()).hexdigest()[:12]
+    return generate_query_hash_bytes(query.encode(), limit)
+
+
+def generate_query_hash_bytes(query_bytes: bytes, limit: int) -> str:
+    """
+    Hash a pre-encoded query.
+
+    Callers that already hold the query as UTF-8 bytes skip the encode
+    that generate_query_hash performs; both produce identical digests.
+    Incremental updates avoid a combined-string allocation — queries can
+    run 100+ chars and this gets called per user in batch loops.
+    """
+    h = hashlib.blake2b(digest_size=6)
+    h.update(query_bytes)
+    h.update(b"|limit:")
+    h.update(str(limit).encode())
+    return h.hexdigest()
 
 
 def _tweet_cache_path(username: str, query_hash: str) -> str:
-    """Generate organized cache path: tweets/jsons/{username}/{hash}.json"""
+    """Generate organized cache path: tweets/jsons/{username}/{hash}.json.gz"""
     safe_username = username.replace("@", "")
-    project_root = Path(__file__).resolve().parents[1]
-    cache_dir = project_root / "data" / "jsons" / "tweets" / safe_username
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return str(cache_dir / f"{query_hash}.json")
+    cache_dir = _ensure_dir(str(JSONS_DIR / "tweets" / safe_username))
+    return str(cache_dir / f"{query_hash}.json.gz")
 
 
 def save_tweet_cache(
@@ -545,9 +1074,8 @@ def save_tweet_cache(
         "tweets": data.get("tweets", [])
     }
     
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, ensure_ascii=False, indent=2)
-    
+    _write_cache_file(cache_path, cache_data)
+
     return cache_path
 
 
@@ -563,29 +1091,84 @@ def load_tweet_cache(
         query_hash: Hash of the query string produced by generate_query_hash
     """
     cache_path = _tweet_cache_path(username, query_hash)
-    
-    if not os.path.exists(cache_path):
-        return None
-    
+
+    # No exists() probe: one open saves a stat syscall per lookup and
+    # avoids the check/open race under concurrent writers
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cached_data = json.load(f)
-        
-        # Return in the same format as get_user_tweets
+        cached_data = _read_cache_file(cache_path)
+        if cached_data is None:
+            return None
+
+        # Return in the same format as get_user_tweets. Pagination state
+        # lives under "metadata" where save_tweet_cache puts it, same as
+        # the follow cache (a top-level lookup always came back False/None).
+        meta = cached_data.get("metadata", {})
         return {
-            "query": cached_data.get("metadata", {}).get("query", ""),
-            "has_next_page": cached_data.get("has_next_page", False),
-            "next_cursor": cached_data.get("next_cursor"),
+            "query": meta.get("query", ""),
+            "has_next_page": meta.get("has_next_page", False),
+            "next_cursor": meta.get("next_cursor"),
             "status": "success",
             "message": f"Loaded {len(cached_data.get('tweets', []))} tweets from cache",
             "tweets": cached_data.get("tweets", []),
         }
         
-    except (json.JSONDecodeError, KeyError) as e:
-        print(f"❌ Cache file corrupted: {e}")
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError) as e:
+        logger.warning("Cache file corrupted: %s", e)
         return None
 
 
+def iter_tweet_cache(username: str, query_hash: str):
+    """
+    Yield cached tweets one at a time instead of materializing the cache.
+
+    With ijson installed, multi-MB caches are decoded incrementally so
+    peak memory stays proportional to one tweet rather than the whole
+    file. Without it (or when the payload is already in the memory tier)
+    the full parse is reused and iterated. Yields nothing for a missing
+    or corrupt cache, mirroring load_tweet_cache returning None.
+
+    Args:
+        username: Twitter handle (with or without leading @)
+        query_hash: Hash of the query string produced by generate_query_hash
+    """
+    cache_path = _tweet_cache_path(username, query_hash)
+
+    # Already parsed in memory: no point re-reading the file
+    cached_data = _mem_cache_get(cache_path)
+    if cached_data is not None:
+        yield from cached_data.get("tweets", [])
+        return
+
+    if ijson is None:
+        try:
+            cached_data = _read_cache_file(cache_path)
+        except (FileNotFoundError, ValueError):
+            return
+        if cached_data:
+            yield from cached_data.get("tweets", [])
+        return
+
+    try:
+        raw_f = open(cache_path, "rb")
+    except FileNotFoundError:
+        return
+    with raw_f:
+        # Same magic-byte sniff as _read_cache_file: caches are gzipped
+        # now, but pre-compression plain-JSON files should still stream
+        magic = raw_f.read(2)
+        raw_f.seek(0)
+        f = gzip.open(raw_f, "rb") if magic == b"\x1f\x8b" else raw_f
+        # Torn gzip streams surface mid-iteration as EOFError/BadGzipFile;
+        # treat them like any other corrupt cache and stop yielding
+        try:
+            yield from ijson.items(f, "tweets.item")
+        except (EOFError, gzip.BadGzipFile, ValueError) as e:
+            logger.warning("Cache file corrupted: %s", e)
+            return
+
+
 def get_user_tweets_cached(
     api_key: str,
     username: str,
@@ -596,36 +1179,65 @@ def get_user_tweets_cached(
     include_replies: bool = True,
 ) -> Dict:
     """get_user_tweets with automatic caching."""
-    # Build query (same as get_user_tweets)
-    handle = username[1:] if username.startswith("@") else username
-    parts = [f"from:{handle}"]
-    if start_date:
-        parts.append(f"since:{start_date}")
-    if end_date:
-        parts.append(f"until:{end_date}")
-    if min_faves:
-        parts.append(f"min_faves:{min_faves}")
-    if not include_replies:
-        parts.append("-is:reply")
-    
-    query = " ".join(parts)
-    query_hash = generate_query_hash(query, limit)
+    handle = _normalize_handle(username)
+    query, query_hash = _build_query_and_hash(
+        handle, limit, start_date, end_date, min_faves, include_replies
+    )
     
     # Check cache first
     cached = load_tweet_cache(username, query_hash)
     if cached:
-        print(f"✅ C-Hit: Q: `{query}`")
+        logger.debug("Cache hit for query `%s`", query)
         return cached
     
-    # Cache miss - fetch from API
-    print(f"🔄 C-Miss: Fetching with Q: `{query}`")
-    data = get_user_tweets(api_key, username, limit, start_date, end_date, min_faves, include_replies)
+    # Cache miss - fetch from API with the query built above instead of
+    # having get_user_tweets rebuild it from the same arguments
+    logger.debug("Cache miss: fetching query `%s`", query)
+    data = search_tweets_advanced(
+        query=query,
+        limit=limit,
+        start_cursor=None,
+        api_key=api_key,
+        query_type="Latest",
+    )
     
     # Save to cache
     save_tweet_cache(username, query, limit, query_hash, data)
-    print(f"💾 Cached {len(data.get('tweets', []))} tweets")
-    
+    logger.debug("Cached %d tweets", len(data.get('tweets', [])))
+
     return data
 
 
+def get_many_user_tweets_cached(
+    api_key: str,
+    usernames: List[str],
+    limit: int = 20,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    min_faves: Optional[int] = None,
+    include_replies: bool = True,
+    max_workers: int = 8,
+) -> Dict[str, Dict]:
+    """
+    get_user_tweets_cached for many users, fetched concurrently.
+
+    requests releases the GIL during socket waits, so a small thread pool
+    overlaps the per-user network latency instead of paying it serially.
+    Warm cache entries return almost instantly without tying up a worker,
+    and the shared SESSION's 429-aware retry/backoff keeps the fan-out
+    within API rate limits.
+
+    Returns:
+        Dict mapping each username to its get_user_tweets_cached result.
+    """
+    def fetch(u: str) -> Dict:
+        return get_user_tweets_cached(
+            api_key, u, limit, start_date, end_date, min_faves, include_replies
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        results = list(ex.map(fetch, usernames))
+    return dict(zip(usernames, results))
+
+
 